@@ -2,56 +2,76 @@
 """
 Test runner script for the Mergington High School Activities API
 
-This script can be used to run tests in different modes:
-- Basic test run
-- Test with coverage
-- Test with verbose output
+This script runs the full test suite once, in verbose mode, with coverage
+reporting enabled. Pass --html to also write an HTML coverage report, and
+--lf, --ff or -x to speed up iterative runs using pytest's last-failed cache.
 """
 
-import subprocess
+import argparse
 import sys
 import os
 from pathlib import Path
 
-def run_command(cmd, description):
-    """Run a command and handle the output"""
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+def run_pytest(args, description):
+    """Run pytest in-process and handle the output"""
     print(f"\n🔍 {description}")
     print("=" * 50)
     
-    try:
-        result = subprocess.run(cmd, shell=True, check=True, cwd=Path(__file__).parent)
+    exit_code = pytest.main(args)
+    if exit_code == pytest.ExitCode.OK:
         print(f"✅ {description} completed successfully!")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed with exit code {e.returncode}")
-        return False
+    print(f"❌ {description} failed with exit code {int(exit_code)}")
+    return False
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Run the Mergington High School Activities API test suite")
+    parser.add_argument("--html", action="store_true",
+                        help="also write an HTML coverage report to htmlcov/")
+    parser.add_argument("--lf", action="store_true",
+                        help="rerun only the tests that failed last time")
+    parser.add_argument("--ff", action="store_true",
+                        help="run the tests that failed last time first, then the rest")
+    parser.add_argument("-x", "--exitfirst", action="store_true",
+                        help="stop on the first failing test")
+    return parser.parse_args()
 
 def main():
     """Main test runner function"""
-    # Get the project root directory
-    project_root = Path(__file__).parent
-    python_path = project_root / ".venv" / "bin" / "python"
-    
-    if not python_path.exists():
-        print("❌ Virtual environment not found. Please run 'configure_python_environment' first.")
-        sys.exit(1)
+    args = parse_args()
+    os.chdir(PROJECT_ROOT)
     
     print("🧪 Mergington High School Activities API - Test Suite")
     print("=" * 60)
     
-    # Run basic tests
-    basic_tests_cmd = f"{python_path} -m pytest tests/ -v"
-    if not run_command(basic_tests_cmd, "Running basic tests"):
-        sys.exit(1)
-    
-    # Run tests with coverage
-    coverage_cmd = f"{python_path} -m pytest tests/ --cov=src --cov-report=term-missing --cov-report=html"
-    if not run_command(coverage_cmd, "Running tests with coverage"):
+    # Run tests with coverage in a single pass
+    coverage_args = [
+        "tests/", "-v",
+        "-n", "auto", "--dist=loadfile",
+        "--cov=src", "--cov-report=term-missing",
+        # Report the slowest tests and fixtures to guide future speedups
+        "--durations=10", "--durations-min=0.05",
+    ]
+    if args.html:
+        coverage_args.append("--cov-report=html")
+    if args.lf:
+        coverage_args.append("--lf")
+    if args.ff:
+        coverage_args.append("--ff")
+    if args.exitfirst:
+        coverage_args.append("--exitfirst")
+    if not run_pytest(coverage_args, "Running tests with coverage"):
         sys.exit(1)
     
     print("\n🎉 All tests passed successfully!")
-    print("📊 Coverage report saved to htmlcov/index.html")
+    if args.html:
+        print("📊 Coverage report saved to htmlcov/index.html")
     print("🚀 Your API is ready for deployment!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,66 +2,87 @@
 Test configuration and fixtures for the Mergington High School Activities API
 """
 
+import functools
+
 import pytest
-from httpx import AsyncClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from fastapi.testclient import TestClient
-import copy
-
-# Import the app from the src directory
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+# src/ is put on sys.path by the pythonpath setting in pytest.ini
 from app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
+@functools.lru_cache(maxsize=1)
+def _make_client():
+    """Build the TestClient once per process"""
     return TestClient(app)
 
 
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app, shared across the session"""
+    return _make_client()
+
+
 @pytest.fixture
+def signup(client):
+    """Return a helper that signs an email up for an activity"""
+    def _signup(email, activity="Chess Club"):
+        return client.post(f"/activities/{activity}/signup", params={"email": email})
+    return _signup
+
+
+@pytest.fixture
+def remove(client):
+    """Return a helper that removes an email from an activity"""
+    def _remove(email, activity="Chess Club"):
+        return client.delete(f"/activities/{activity}/remove", params={"email": email})
+    return _remove
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_client():
-    """Create an async test client for the FastAPI app"""
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    """Create an async test client for the FastAPI app, shared across the session"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
 
 
+# Initial activities state, built once at import and cloned before each test.
+# Never hand these participant lists out directly; always copy them.
+_INITIAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    }
+}
+
+
 @pytest.fixture(autouse=True)
 def reset_activities():
-    """Reset activities data before each test"""
-    # Store original activities
-    original_activities = copy.deepcopy(activities)
-    
-    # Reset to initial state
+    """Reset activities data before each test, unless it is already pristine"""
+    # Plain dict equality: the template uses lists, just like the live data
+    if activities == _INITIAL_ACTIVITIES:
+        return
     activities.clear()
     activities.update({
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
+        name: {**info, "participants": info["participants"][:]}
+        for name, info in _INITIAL_ACTIVITIES.items()
     })
-    
-    yield
-    
-    # Restore original activities after test
-    activities.clear()
-    activities.update(original_activities)
 
 
 @pytest.fixture
@@ -2,8 +2,13 @@
 Tests for data validation and edge cases in the Activities API
 """
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
+from httpx import AsyncClient
+
+from app import activities
 
 
 class TestDataValidation:
@@ -51,25 +56,27 @@ class TestDataValidation:
                 pytest.skip(f"Activity '{activity_name}' has more participants than max_participants. "
                            f"This indicates max_participants enforcement is not yet implemented.")
 
-    def test_special_characters_in_emails(self, client: TestClient):
+    @pytest.mark.parametrize("email", [
+        "user+tag@mergington.edu",  # Plus sign
+        "user.name@mergington.edu",  # Dot
+        "user_name@mergington.edu",  # Underscore
+        "user-name@mergington.edu",  # Hyphen
+    ])
+    async def test_special_characters_in_emails(self, async_client: AsyncClient, email):
         """Test handling of special characters in email addresses"""
-        test_cases = [
-            "user+tag@mergington.edu",  # Plus sign
-            "user.name@mergington.edu",  # Dot
-            "user_name@mergington.edu",  # Underscore
-            "user-name@mergington.edu",  # Hyphen
-        ]
-        
         activity_name = "Programming Class"
         
-        for email in test_cases:
-            # Test signup
-            signup_response = client.post(f"/activities/{activity_name}/signup?email={email}")
-            assert signup_response.status_code == 200
-            
-            # Test removal
-            remove_response = client.delete(f"/activities/{activity_name}/remove?email={email}")
-            assert remove_response.status_code == 200
+        # Test signup
+        signup_response = await async_client.post(
+            f"/activities/{activity_name}/signup", params={"email": email}
+        )
+        assert signup_response.status_code == 200
+        
+        # Test removal
+        remove_response = await async_client.delete(
+            f"/activities/{activity_name}/remove", params={"email": email}
+        )
+        assert remove_response.status_code == 200
 
     def test_case_sensitivity_in_activity_names(self, client: TestClient):
         """Test case sensitivity in activity names"""
@@ -86,36 +93,28 @@ class TestDataValidation:
         response = client.post("/activities/Chess Club/signup", params={"email": test_email})
         assert response.status_code == 200
 
-    def test_empty_activity_participants_list(self, client: TestClient):
+    def test_empty_activity_participants_list(self, remove):
         """Test activities with no participants"""
-        # First, remove all participants from an activity
-        response = client.get("/activities")
-        activities_data = response.json()
-        
-        # Find an activity with participants
+        # First, find an activity with participants
         activity_with_participants = None
-        for name, info in activities_data.items():
+        for name, info in activities.items():
             if info["participants"]:
                 activity_with_participants = name
                 break
         
         if activity_with_participants:
             # Remove all participants
-            original_participants = activities_data[activity_with_participants]["participants"].copy()
+            original_participants = activities[activity_with_participants]["participants"].copy()
             
             for participant in original_participants:
-                remove_response = client.delete(
-                    f"/activities/{activity_with_participants}/remove?email={participant}"
-                )
+                remove_response = remove(participant, activity_with_participants)
                 assert remove_response.status_code == 200
             
             # Check that the activity still exists and has an empty participants list
-            response = client.get("/activities")
-            updated_activities = response.json()
-            assert activity_with_participants in updated_activities
-            assert updated_activities[activity_with_participants]["participants"] == []
+            assert activity_with_participants in activities
+            assert activities[activity_with_participants]["participants"] == []
 
-    def test_concurrent_signups_same_activity(self, client: TestClient):
+    async def test_concurrent_signups_same_activity(self, async_client: AsyncClient):
         """Test multiple signups to the same activity"""
         activity_name = "Gym Class"
         test_emails = [
@@ -124,17 +123,17 @@ class TestDataValidation:
             "concurrent3@mergington.edu"
         ]
         
-        # Sign up multiple students
-        for email in test_emails:
-            response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        # Sign up multiple students concurrently
+        responses = await asyncio.gather(*[
+            async_client.post(f"/activities/{activity_name}/signup", params={"email": email})
+            for email in test_emails
+        ])
+        for response in responses:
             assert response.status_code == 200
         
         # Verify all were added
-        response = client.get("/activities")
-        activities_data = response.json()
-        
         for email in test_emails:
-            assert email in activities_data[activity_name]["participants"]
+            assert email in activities[activity_name]["participants"]
 
     def test_participant_uniqueness(self, client: TestClient):
         """Test that participant lists don't have duplicates"""
@@ -148,38 +147,38 @@ class TestDataValidation:
             assert len(participants) == len(unique_participants), \
                 f"Activity '{activity_name}' has duplicate participants: {participants}"
 
-    def test_long_email_addresses(self, client: TestClient):
+    def test_long_email_addresses(self, signup, remove):
         """Test handling of very long email addresses"""
         # Create a long but valid email
         long_email = "a" * 50 + "@" + "b" * 50 + ".edu"
         activity_name = "Chess Club"
         
-        response = client.post(f"/activities/{activity_name}/signup?email={long_email}")
+        response = signup(long_email, activity_name)
         # Should handle long emails (current implementation doesn't have length limits)
         assert response.status_code == 200
         
         # Test removal
-        response = client.delete(f"/activities/{activity_name}/remove?email={long_email}")
+        response = remove(long_email, activity_name)
         assert response.status_code == 200
 
-    def test_response_json_structure(self, client: TestClient):
+    def test_response_json_structure(self, signup, remove):
         """Test that API responses have consistent JSON structure"""
         # Test successful signup response
-        response = client.post("/activities/Chess Club/signup?email=json.test@mergington.edu")
+        response = signup("json.test@mergington.edu")
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert isinstance(data["message"], str)
         
         # Test error response structure
-        response = client.post("/activities/Nonexistent/signup?email=test@mergington.edu")
+        response = signup("test@mergington.edu", "Nonexistent")
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
         assert isinstance(data["detail"], str)
         
         # Test successful removal response
-        response = client.delete("/activities/Chess Club/remove?email=json.test@mergington.edu")
+        response = remove("json.test@mergington.edu")
         assert response.status_code == 200
         data = response.json()
         assert "message" in data